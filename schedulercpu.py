@@ -1,10 +1,17 @@
 # === Step 1: Import necessary libraries ===
 # 'customtkinter' is the library we use to create the modern graphical user interface (GUI).
 import customtkinter as ctk
-# 'time' is used to create artificial delays (time.sleep) to simulate the CPU working.
-import time
+# 'tkinter' is the plain Tk toolkit that customtkinter is built on. Its widgets are simpler and cheaper to create.
+import tkinter as tk
 # 'collections.deque' is Python's specialized and highly efficient implementation of a Queue.
 from collections import deque
+# 'logging' prints our debugging messages. Messages below the chosen level cost (almost) nothing.
+import logging
+# 'itertools.count' hands out the numbers 1, 2, 3, ... for new process names.
+from itertools import count
+
+# The logger for this file. Its level decides which of our debugging messages are actually shown.
+log = logging.getLogger(__name__)
 
 # === Step 2: Define the Main GUI Application ===
 # We create a class that inherits from CustomTkinter's 'CTk' class. This makes our class the main application window.
@@ -15,6 +22,26 @@ class SchedulerApp(ctk.CTk):
         self.title("CPU Scheduler Simulation (FIFO Queue)")
         self.geometry("800x400")
 
+        # --- Fonts ---
+        # We create each font once and share it between widgets, instead of building a new font for every label.
+        self._hdr_font = ctk.CTkFont(size=16, weight="bold")   # Section headers ("CPU", "Ready Queue").
+        self._cpu_font = ctk.CTkFont(size=20, weight="bold")   # The process shown in the CPU.
+        self._proc_font = ctk.CTkFont(size=18, weight="bold")  # The processes shown in the queue.
+        # The queue tiles are plain Tk labels (see '_make_label'), and plain Tk doesn't know about customtkinter's
+        # scaling for high-DPI screens. So we scale their font and spacing ourselves, by the same factor the CTk
+        # widgets use. This is read once at startup; a scaling change while the app is running isn't followed.
+        self._tile_scaling = ctk.ScalingTracker.get_widget_scaling(self)
+        self._proc_font_tk = self._proc_font.create_scaled_tuple(self._tile_scaling)
+
+        # --- Callbacks ---
+        # Every time we write 'self.some_method', Python builds a new "bound method" object.
+        # We build the ones used as callbacks once here and reuse them on every timer tick and button click.
+        self._cb_add = self.add_process
+        self._cb_start = self.start_simulation
+        self._cb_next = self.process_next_item
+        self._cb_finish = self._finish_current
+        self._cb_flush = self._flush_redraw
+
         # --- The Core Data Structure: A Queue ---
         # We declare our queue here. 'deque' is chosen because it provides very fast, O(1) time complexity
         # for adding to the end and removing from the front, which is perfect for a queue.
@@ -22,10 +49,20 @@ class SchedulerApp(ctk.CTk):
         # In this implementation:
         # - Adding to the queue (ENQUEUE) is done with the .append() method.
         # - Removing from the queue (DEQUEUE) is done with the .popleft() method.
+        #
+        # Each item is a (name, label) pair: the process name, and the GUI label showing it in the queue.
+        # The label is None until the process has been drawn. Keeping both together means the process and
+        # its label always leave the queue at the same time.
         self.process_queue = deque()
         
         # A simple counter to give each new process a unique name (P1, P2, etc.).
-        self.process_counter = 0
+        # next(self._pid_gen) returns 1 the first time, then 2, and so on.
+        self._pid_gen = count(1)
+
+        # How many processes the CPU takes from the queue on each tick. The default of 1 is the classic
+        # one-at-a-time FIFO simulation; a bigger value drains the queue faster (e.g. for stress tests).
+        # Values below 1 are treated as 1.
+        self.batch_size = 1
 
         # --- GUI Section 1: The Control Buttons ---
         # A Frame is a container to help organize other widgets.
@@ -34,11 +71,11 @@ class SchedulerApp(ctk.CTk):
 
         # The 'Add New Process' button. The 'command' parameter links this button's click event
         # to our 'add_process' function. This is the user's trigger for the ENQUEUE operation.
-        self.add_button = ctk.CTkButton(control_frame, text="Add New Process", command=self.add_process)
+        self.add_button = ctk.CTkButton(control_frame, text="Add New Process", command=self._cb_add)
         self.add_button.pack(side="left", padx=10, pady=10)
 
         # The 'Start Simulation' button. Its click event is linked to the 'start_simulation' function.
-        self.start_button = ctk.CTkButton(control_frame, text="Start Simulation", command=self.start_simulation)
+        self.start_button = ctk.CTkButton(control_frame, text="Start Simulation", command=self._cb_start)
         self.start_button.pack(side="left", padx=10, pady=10)
 
         # --- GUI Section 2: The Visualization Area ---
@@ -48,57 +85,109 @@ class SchedulerApp(ctk.CTk):
         vis_frame.grid_columnconfigure(1, weight=1) # This allows the queue frame to stretch horizontally.
 
         # The "CPU" visual area.
-        ctk.CTkLabel(vis_frame, text="CPU", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=0, padx=10)
+        ctk.CTkLabel(vis_frame, text="CPU", font=self._hdr_font).grid(row=0, column=0, padx=10)
         self.cpu_frame = ctk.CTkFrame(vis_frame, fg_color="gray20", height=80, width=100)
         self.cpu_frame.grid(row=1, column=0, padx=10, pady=10)
-        self.cpu_label = ctk.CTkLabel(self.cpu_frame, text="", font=ctk.CTkFont(size=20, weight="bold"))
+        self.cpu_label = ctk.CTkLabel(self.cpu_frame, text="", font=self._cpu_font)
         self.cpu_label.place(relx=0.5, rely=0.5, anchor="center") # .place() centers the text inside the frame.
 
         # The "Ready Queue" visual area, which will show the state of our queue data structure.
-        ctk.CTkLabel(vis_frame, text="Ready Queue (FIFO)", font=ctk.CTkFont(size=16, weight="bold")).grid(row=0, column=1, padx=10)
+        ctk.CTkLabel(vis_frame, text="Ready Queue (FIFO)", font=self._hdr_font).grid(row=0, column=1, padx=10)
         self.queue_frame = ctk.CTkFrame(vis_frame, fg_color="gray20", height=80)
         self.queue_frame.grid(row=1, column=1, padx=10, pady=10, sticky="ew") # 'sticky="ew"' makes it stretch East-West.
+        # Keep the frame at its own fixed height instead of letting it shrink or grow to fit the labels packed
+        # inside it. Otherwise every ENQUEUE and DEQUEUE would make Tk re-measure the frame and its parents.
+        # (The CPU frame doesn't need this: its label uses .place(), which never resizes the frame.)
+        self.queue_frame.pack_propagate(False)
 
-        # This is a helper list. It does NOT store the processes themselves,
-        # but it keeps track of the GUI label widgets we create so we can easily delete them later when we refresh the display.
-        self.queue_labels = []
+        # Creating widgets is slow, so we build a pool of 16 queue labels once, up front.
+        # Labels are taken from this pool when a process is shown and handed back when it leaves the queue.
+        # If the queue ever grows past the pool, extra labels are created as needed.
+        self._label_pool = [self._make_label() for _ in range(16)]
+
+        # True while a queue redraw has been scheduled but has not run yet.
+        # Several quick ENQUEUEs then share a single redraw instead of each doing their own.
+        self._redraw_pending = False
 
     def add_process(self):
         """
         This function handles the ENQUEUE operation. It's called when the user clicks 'Add New Process'.
         It adds a new item to the END of the process_queue.
         """
-        self.process_counter += 1
-        process_name = f"P{self.process_counter}"
+        process_name = "P" + str(next(self._pid_gen))
         
         # --- THIS IS THE ENQUEUE OPERATION ---
         # We use .append() to add the new process to the right side (the end) of our deque.
-        self.process_queue.append(process_name)
+        # It has no label yet; the next redraw gives it one.
+        self.process_queue.append((process_name, None))
         
-        # Print to the console for our own debugging to confirm the state of the queue.
-        print(f"ENQUEUE: Added {process_name}. Queue is now: {list(self.process_queue)}")
+        # Log for our own debugging to confirm the state of the queue (only shown at DEBUG level).
+        # We only build the list of names if the message will actually be shown, so this is almost free otherwise.
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("ENQUEUE: %s queue=%s", process_name, [name for name, _ in self.process_queue])
         
         # After modifying the data structure, we must update the GUI to reflect the change.
-        self.update_queue_display()
+        # We don't redraw right away: we ask for a redraw in 33ms (about 30 times per second at most),
+        # so a burst of new processes is drawn in one go.
+        if not self._redraw_pending:
+            self._redraw_pending = True
+            self.after(33, self._cb_flush)
+
+    def _flush_redraw(self):
+        """
+        This function is purely for the GUI. It runs once per scheduled redraw and adds labels
+        for every process that was enqueued since the last redraw.
+        """
+        self._redraw_pending = False
+        # The processes without a label are always at the end of the queue, so we take them off the end...
+        new_names = []
+        while self.process_queue and self.process_queue[-1][1] is None:
+            new_names.append(self.process_queue.pop()[0])
+        # ...and put them back in their original order, this time together with their label.
+        for process_name in reversed(new_names):
+            self.process_queue.append((process_name, self._append_label(process_name)))
 
-    def update_queue_display(self):
+    def _make_label(self):
         """
-        This function is purely for the GUI. It redraws the visual representation of the queue.
-        It reads the current state of the 'process_queue' deque and creates a label for each item.
+        This function is purely for the GUI. It creates an empty, hidden label for the queue display.
         """
-        # First, destroy all the old labels to clear the display.
-        for label in self.queue_labels:
-            label.destroy()
-        self.queue_labels.clear()
+        # A plain Tk label is much cheaper than a CTkLabel (which is a frame, a canvas and a label in one).
+        # The queue tiles don't need rounded corners, so the simple one is enough here.
+        return tk.Label(self.queue_frame, text="",
+                        bg="#1e90ff", fg="white",
+                        padx=round(8 * self._tile_scaling), pady=round(4 * self._tile_scaling),
+                        font=self._proc_font_tk)
 
-        # Then, create new labels for each process currently in our queue data structure.
-        for i, process_name in enumerate(self.process_queue):
-            proc_label = ctk.CTkLabel(self.queue_frame, text=process_name, 
-                                      fg_color="dodgerblue", corner_radius=5,
-                                      font=ctk.CTkFont(size=18, weight="bold"))
-            # We use .place() to position them side-by-side to visually look like a queue.
-            proc_label.place(x=10 + i * 80, y=25)
-            self.queue_labels.append(proc_label)
+    def _append_label(self, process_name):
+        """
+        This function is purely for the GUI. It adds a label for a new process to the end of the visual queue
+        and returns it.
+        """
+        # Reuse a label from the pool, and only create a new one if the pool has run out.
+        proc_label = self._label_pool.pop() if self._label_pool else self._make_label()
+        proc_label.configure(text=process_name)
+        # We use .pack(side="left") to line them up side-by-side so they visually look like a queue.
+        # Tk works out the positions itself, and a new label always goes after the ones already shown.
+        proc_label.pack(side="left", padx=round(5 * self._tile_scaling), pady=round(20 * self._tile_scaling))
+        return proc_label
+
+    def _release_label(self, proc_label):
+        """
+        This function is purely for the GUI. It removes a label from the visual queue.
+        Tk slides the remaining labels to the left on its own.
+        """
+        # Hide the label and give it back to the pool instead of destroying it.
+        proc_label.pack_forget()
+        self._label_pool.append(proc_label)
+
+    def _set_buttons(self, state):
+        """
+        Sets both control buttons to 'state' ("normal" or "disabled").
+        A button is only reconfigured if its state actually changes.
+        """
+        for button in (self.add_button, self.start_button):
+            if button.cget("state") != state:
+                button.configure(state=state)
 
     def start_simulation(self):
         """
@@ -106,54 +195,77 @@ class SchedulerApp(ctk.CTk):
         It disables the buttons and begins the process of dequeuing items.
         """
         # Disable buttons to prevent the user from adding new processes while the simulation is running.
-        self.add_button.configure(state="disabled")
-        self.start_button.configure(state="disabled")
+        self._set_buttons("disabled")
 
         # Call the function that will process the first item from the queue.
         self.process_next_item()
 
     def process_next_item(self):
         """
-        This function handles the DEQUEUE operation. It takes one item from the front of the queue
-        and "processes" it. It then schedules itself to run again to process the next item.
+        This function handles the DEQUEUE operation. If the queue still has items it hands the next
+        'batch_size' of them to the CPU, otherwise it ends the simulation.
         """
         # We only proceed if our queue data structure is not empty.
         if self.process_queue:
-            # --- THIS IS THE DEQUEUE OPERATION ---
-            # We use .popleft() to remove the process from the left side (the front) of our deque.
-            # This is the essence of the First-In, First-Out (FIFO) principle.
-            current_process = self.process_queue.popleft()
-            
-            # Print to the console for our own debugging.
-            print(f"DEQUEUE: Processing {current_process}. Queue is now: {list(self.process_queue)}")
-
-            # --- Visualization Steps ---
-            self.update_queue_display() # Update the queue display to show that the item has left.
-            self.cpu_label.configure(text=current_process, fg_color="limegreen") # Show the current process in the "CPU".
-            self.update() # Force the GUI to redraw immediately.
-
-            # This simulates the CPU doing work. We pause the program for 2 seconds.
-            time.sleep(2)
-
-            # Clear the CPU display to show the process is finished.
-            self.cpu_label.configure(text="", fg_color="transparent")
-            self.update()
-            
-            # This is how we create an animation loop in a GUI.
-            # Instead of a 'while' loop that would freeze the window, we tell the app to call this function again
-            # after a 500ms delay. This keeps the GUI responsive.
-            self.after(500, self.process_next_item)
+            self._dispatch_current()
         else:
             # If the queue is empty, the simulation is over.
-            print("Simulation Finished: Queue is empty.")
+            log.info("Simulation Finished: Queue is empty.")
             # Re-enable the buttons so the user can run another simulation.
-            self.add_button.configure(state="normal")
-            self.start_button.configure(state="normal")
+            self._set_buttons("normal")
+
+    def _dispatch_current(self):
+        """
+        Takes up to 'batch_size' items from the front of the queue and puts them on the "CPU".
+        The CPU is released again by '_finish_current' once the simulated work is done.
+        """
+        # At least one process is always taken, even if 'batch_size' was set to 0 or less.
+        for _ in range(max(1, self.batch_size)):
+            if not self.process_queue:
+                break
+            # --- THIS IS THE DEQUEUE OPERATION ---
+            # We use .popleft() to remove the process from the left side (the front) of our deque.
+            # This is the essence of the First-In, First-Out (FIFO) principle.
+            current_process, proc_label = self.process_queue.popleft()
+
+            # Log for our own debugging (only shown at DEBUG level).
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("DEQUEUE: %s queue=%s", current_process, [name for name, _ in self.process_queue])
+
+            # Update the queue display to show that the item has left.
+            # The process may have been dequeued before its label was ever drawn.
+            if proc_label is not None:
+                self._release_label(proc_label)
+
+        # --- Visualization Steps ---
+        # The "CPU" shows the last process taken.
+        self.cpu_label.configure(text=current_process, fg_color="limegreen") # Show the current process in the "CPU".
+
+        # This simulates the CPU doing work for 2 seconds. Instead of pausing the program (which would freeze
+        # the window), we ask the event loop to call '_finish_current' later. Until then the GUI stays responsive.
+        # No self.update() or self.update_idletasks() is needed here: Tk paints pending changes on its own
+        # once this callback returns to the event loop.
+        self.after(2000, self._cb_finish)
+
+    def _finish_current(self):
+        """
+        Called when the simulated work is done. It clears the "CPU" and schedules the next DEQUEUE.
+        """
+        # Clear the CPU display to show the process is finished.
+        self.cpu_label.configure(text="", fg_color="transparent")
+
+        # This is how we create an animation loop in a GUI.
+        # Instead of a 'while' loop that would freeze the window, we tell the app to call 'process_next_item'
+        # again after a short 50ms pause. The pause is only there so the empty CPU is visible for a moment
+        # between two processes; the 2 seconds of "work" already happened while the process was on the CPU.
+        self.after(50, self._cb_next)
 
 # --- Step 3: Start the Application ---
 # This is a standard Python entry point. The code inside this 'if' block only runs
 # when the script is executed directly.
 if __name__ == "__main__":
+    # Show INFO messages (like "Simulation Finished") on the console. Use logging.DEBUG to also see every ENQUEUE/DEQUEUE.
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
     # We create an instance of our SchedulerApp class. This calls the __init__ method and builds the window.
     app = SchedulerApp()
     # app.mainloop() starts the GUI's event loop. The application will now wait for user actions (like button clicks)